@@ -22,7 +22,8 @@ from mflowgen.utils.helpers            import stamp
 class MakeBackend:
 
   def __init__( s ):
-    s.fd = open( 'Makefile', 'w' )
+    # Large buffer: build file is emitted via many small writes
+    s.fd = open( 'Makefile', 'w', buffering=1<<16 )
     s.w = MakeWriter( s.fd )
     # Track debug targets for list command
     s.debug_targets = {}
@@ -21,7 +21,8 @@ from mflowgen.backends.ninja_syntax_extra import ninja_graph, ninja_status, ninj
 class NinjaBackend:
 
   def __init__( s ):
-    s.fd = open( 'build.ninja', 'w' )
+    # Large buffer: build file is emitted via many small writes
+    s.fd = open( 'build.ninja', 'w', buffering=1<<16 )
     s.w = NinjaWriter( s.fd )
     # Track debug targets for list command
     s.debug_targets = {}
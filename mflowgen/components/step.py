@@ -10,6 +10,7 @@ import os
 import yaml
 
 from mflowgen.utils import get_top_dir, read_yaml, write_yaml
+from mflowgen.utils import YAMLDumper
 
 class Step:
 
@@ -570,7 +571,7 @@ class Step:
       if len( data.splitlines() ) > 1:
         tmp.update( { 'style' : '|' } )
       return dumper.represent_scalar( **tmp )
-    yaml.add_representer( str, str_representer )
+    yaml.add_representer( str, str_representer, Dumper=YAMLDumper )
 
     # Dump the content
 
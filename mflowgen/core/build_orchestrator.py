@@ -14,6 +14,10 @@ import shutil
 from mflowgen.assertions.assertion_helpers import dump_assertion_check_scripts
 from mflowgen.utils import get_top_dir, get_files_in_dir
 
+# Build directories are named "<build_id>-<step_name>"
+
+_build_dir_re = re.compile( r'(\d+)-(.*)' )
+
 class BuildOrchestrator:
 
   def __init__( s, graph, backend_writer_cls ):
@@ -318,15 +322,20 @@ N. For a completely clean build, run the "clean-all" target.\n''' )
 
     existing_build_ids = {}
 
-    for dir_name in os.listdir('.'): # search the current directory
-      if os.path.isdir( dir_name ):
-        m = re.match( r'(\d+)-(.*)', dir_name )
-        if m:
-          build_id  = m.group(1)
-          step_name = m.group(2)
-          if step_name in s.order: # only save if also in the new graph
-            if build_id not in existing_build_ids.values(): # keep unique
-              existing_build_ids[ step_name ] = build_id
+    # Use scandir so that the directory check reuses the file type from
+    # the directory listing instead of an extra stat per entry
+
+    with os.scandir('.') as entries: # search the current directory
+      dir_names = [ e.name for e in entries if e.is_dir() ]
+
+    for dir_name in dir_names:
+      m = _build_dir_re.match( dir_name )
+      if m:
+        build_id  = m.group(1)
+        step_name = m.group(2)
+        if step_name in s.order: # only save if also in the new graph
+          if build_id not in existing_build_ids.values(): # keep unique
+            existing_build_ids[ step_name ] = build_id
 
     return existing_build_ids
 
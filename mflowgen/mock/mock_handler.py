@@ -20,10 +20,10 @@ class MockHandler:
 
     # Valid commands
 
-    s.commands = [
+    s.commands = frozenset([
       'init',
       'help',
-    ]
+    ])
 
 
   #-----------------------------------------------------------------------
@@ -59,7 +59,7 @@ class StashHandler:
 
     # Valid commands
 
-    s.commands = [
+    s.commands = frozenset([
       'init',
       'link',
       'list',
@@ -68,7 +68,7 @@ class StashHandler:
       'pop',
       'drop',
       'help',
-    ]
+    ])
 
     # Read YAML: Grab link path from hidden YAML
 
@@ -658,7 +658,9 @@ class StashHandler:
 
     existing_steps = os.listdir( '.mflowgen' )
 
-    m = [ re.match( r'^(\d+)-' + step + '$', _ ) \
+    build_dir_re = re.compile( r'^(\d+)-' + re.escape( step ) + '$' )
+
+    m = [ build_dir_re.match( _ ) \
             for _ in existing_steps ]  # e.g., "4-synopsys-dc-synthesis"
     m = [ _ for _ in m if _ ]          # filter for successful matches
     m = [ _.group(0) for _ in m if _ ] # get build directories
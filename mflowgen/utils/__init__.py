@@ -1,4 +1,5 @@
 from mflowgen.utils.helpers import get_top_dir, get_files_in_dir
 from mflowgen.utils.helpers import bold, yellow, red, green
 from mflowgen.utils.helpers import read_yaml, write_yaml
+from mflowgen.utils.helpers import YAMLDumper
 
@@ -8,6 +8,36 @@
 import os
 import yaml
 
+# Prefer the libyaml-backed loader and dumper, which parse and emit an
+# order of magnitude faster than the pure-Python ones. Fall back to the
+# pure-Python versions if PyYAML was built without libyaml.
+#
+# We subclass them so that anything registered on mflowgen's loader and
+# dumper (e.g., the str representer in Step.dump_yaml) stays local to
+# mflowgen instead of changing PyYAML's classes for the whole process.
+
+try:
+  from yaml import CSafeLoader as _SafeLoader
+  from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+  from yaml import SafeLoader  as _SafeLoader
+  from yaml import SafeDumper  as _SafeDumper
+
+class YAMLLoader( _SafeLoader ):
+  pass
+
+class YAMLDumper( _SafeDumper ):
+  pass
+
+# Older versions of mflowgen dumped tuples with a "!!python/tuple" tag, so
+# keep reading them back as tuples for existing build dirs and stashes
+
+def _construct_python_tuple( loader, node ):
+  return tuple( loader.construct_sequence( node ) )
+
+YAMLLoader.add_constructor( 'tag:yaml.org,2002:python/tuple',
+                            _construct_python_tuple )
+
 #-------------------------------------------------------------------------
 # Utility functions
 #-------------------------------------------------------------------------
@@ -74,11 +104,7 @@ def stamp( p, stamp='.stamp.' ):
 
 def read_yaml( path ):
   with open( path ) as f:
-    try:
-      data = yaml.load( f, Loader=yaml.FullLoader )
-    except AttributeError:
-      # PyYAML for python2 does not have FullLoader
-      data = yaml.load( f )
+    data = yaml.load( f, Loader=YAMLLoader )
   return data
 
 # write_yaml
@@ -88,7 +114,7 @@ def read_yaml( path ):
 
 def write_yaml( data, path ):
   with open( path, 'w' ) as f:
-    yaml.dump( data, f, default_flow_style=False )
+    yaml.dump( data, f, Dumper=YAMLDumper, default_flow_style=False )
 
 #-------------------------------------------------------------------------
 # Colors